@@ -22,9 +22,10 @@
 import asyncio
 import queue
 import threading
+import time
 from collections import deque
 from contextlib import suppress
-from typing import Any, Deque
+from typing import Any, Deque, List, Optional
 
 
 class AsyncFriendlyQueue(queue.Queue):
@@ -73,6 +74,31 @@ class AsyncFriendlyQueue(queue.Queue):
         """
         return super().get(*args, **kwargs)
 
+    def get_many(self, count: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Get a batch of items from the queue, waiting until all of them are available.
+
+        The items are taken at once under the queue mutex, so either all of them
+        are returned or none is removed from the queue.
+
+        :param count: the number of items to get.
+        :param timeout: the maximum time to wait for the items, None to wait forever.
+        :return: the items, in queue order.
+        """
+        with self.not_empty:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self._qsize() < count:
+                if deadline is None:
+                    self.not_empty.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise queue.Empty
+                self.not_empty.wait(remaining)
+            items = [self._get() for _ in range(count)]
+            self.not_full.notify(count)
+            return items
+
     async def async_wait(self) -> None:
         """
         Wait an item appears in the queue.
@@ -30,6 +30,7 @@ from typing import (
     Callable,
     Collection,
     Dict,
+    Iterable,
     List,
     Optional,
     Sequence,
@@ -690,6 +691,19 @@ class AsyncMultiplexer(Runnable, WithLogger):
         except queue.Empty:
             raise Empty
 
+    def get_many(self, count: int, timeout: Optional[float] = None) -> List[Envelope]:
+        """
+        Get a batch of envelopes within a timeout.
+
+        :param count: the number of envelopes to get.
+        :param timeout: the timeout to wait until all the envelopes are received.
+        :return: the envelopes, in the order they were received.
+        """
+        try:
+            return self.in_queue.get_many(count, timeout=timeout)
+        except queue.Empty:
+            raise Empty
+
     async def async_get(self) -> Envelope:
         """
         Get an envelope async way.
@@ -734,6 +748,41 @@ class AsyncMultiplexer(Runnable, WithLogger):
         else:
             self.out_queue.put_nowait(envelope)
 
+    async def _put_many(self, envelopes: Sequence[Envelope]) -> None:
+        """
+        Schedule a batch of envelopes for sending them, preserving their order.
+
+        :param envelopes: the envelopes to be sent.
+        """
+        self._put_many_nowait(envelopes)
+
+    def put_many(self, envelopes: Iterable[Envelope]) -> None:
+        """
+        Schedule a batch of envelopes for sending them, preserving their order.
+
+        Unlike calling `put` for each envelope, the whole batch crosses
+        the thread boundary to the event loop in a single call.
+
+        :param envelopes: the envelopes to be sent.
+        """
+        batch = list(envelopes)
+        if self._threaded:
+            self._loop.call_soon_threadsafe(self._put_many_nowait, batch)
+        else:
+            self._put_many_nowait(batch)
+
+    def _put_many_nowait(self, envelopes: Sequence[Envelope]) -> None:
+        """
+        Put a batch of envelopes in the output queue without blocking.
+
+        This is the only place batches are enqueued, both `put_many` and
+        `_put_many` go through it. The output queue is unbounded.
+
+        :param envelopes: the envelopes to be sent.
+        """
+        for envelope in envelopes:
+            self.out_queue.put_nowait(envelope)
+
     def _setup(
         self,
         connections: Collection[Connection],
@@ -854,6 +903,14 @@ class Multiplexer(AsyncMultiplexer):
         """
         self._thread_runner.call(super()._put(envelope))  # .result(240)
 
+    def put_many(self, envelopes: Iterable[Envelope]) -> None:
+        """
+        Schedule a batch of envelopes for sending them, preserving their order.
+
+        :param envelopes: the envelopes to be sent.
+        """
+        self._thread_runner.call(super()._put_many(list(envelopes)))
+
 
 class InBox:
     """A queue from where you can only consume envelopes."""
@@ -90,7 +90,8 @@ class TestEchoHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received invalid default message={incoming_message}, unidentified dialogue.",
+            "received invalid default message=%s, unidentified dialogue.",
+            incoming_message,
         )
 
     def test_handle_error(self):
@@ -115,7 +116,9 @@ class TestEchoHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received default error message={incoming_message} in dialogue={default_dialogue}.",
+            "received default error message=%s in dialogue=%s.",
+            incoming_message,
+            default_dialogue,
         )
 
     def test_handle_bytes(self):
@@ -143,7 +146,9 @@ class TestEchoHandler(BaseSkillTestCase):
 
         mock_logger.assert_any_call(
             logging.INFO,
-            f"Echo Handler: message={incoming_message}, sender={incoming_message.sender}",
+            "Echo Handler: message=%s, sender=%s",
+            incoming_message,
+            incoming_message.sender,
         )
 
         message = self.get_message_from_outbox()
@@ -180,7 +185,9 @@ class TestEchoHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received invalid message={incoming_message} in dialogue={self.default_dialogues.get_dialogue(incoming_message)}.",
+            "received invalid message=%s in dialogue=%s.",
+            incoming_message,
+            self.default_dialogues.get_dialogue(incoming_message),
         )
 
     def test_retrieve_protocol_dialogues_from_handler(self):
@@ -23,6 +23,8 @@
 import functools
 import inspect
 import itertools
+import os
+import re
 import tempfile
 from typing import Any, Callable, Type
 from unittest import mock
@@ -32,7 +34,30 @@ from packages.fetchai.protocols.default.message import DefaultMessage
 
 TIMEOUT = 20
 TEMP_LIBP2P_TEST_DIR = tempfile.mkdtemp()
-ports = itertools.count(10234)
+# give each pytest-xdist worker (gw0, gw1, ...) its own range of ports
+BASE_PORT = 10234
+PORTS_PER_WORKER = 1000
+MAX_PORT = 65535
+
+
+def _worker_port_offset() -> int:
+    """Get the port offset of the current pytest-xdist worker, 0 if not running under xdist."""
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker_id is None:
+        return 0
+    match = re.fullmatch(r"gw(\d+)", worker_id)
+    if match is None:
+        raise ValueError(f"Unexpected PYTEST_XDIST_WORKER value: {worker_id!r}")
+    worker_index = int(match.group(1))
+    nb_slots = (MAX_PORT - BASE_PORT) // PORTS_PER_WORKER
+    if worker_index >= nb_slots:
+        raise ValueError(
+            f"Worker {worker_id} has no free port range, at most {nb_slots} workers are supported"
+        )
+    return worker_index * PORTS_PER_WORKER
+
+
+ports = itertools.count(BASE_PORT + _worker_port_offset())
 
 MockDefaultMessageProtocol = mock.Mock()
 MockDefaultMessageProtocol.protocol_id = DefaultMessage.protocol_id
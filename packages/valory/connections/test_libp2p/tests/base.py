@@ -26,7 +26,9 @@ import json
 import logging
 import os
 import tempfile
+from functools import lru_cache
 from pathlib import Path
+from threading import Thread
 from typing import List, Optional, Sequence, Union
 
 from aea_ledger_cosmos.cosmos import CosmosCrypto
@@ -274,6 +276,20 @@ def _make_libp2p_connection(
     return connection
 
 
+@lru_cache(maxsize=None)
+def _encode_default_message(content: bytes) -> bytes:
+    """Encode a default message for tests, once per distinct content"""
+
+    message = DefaultMessage(
+        dialogue_reference=("", ""),
+        message_id=1,
+        target=0,
+        performative=DefaultMessage.Performative.BYTES,
+        content=content,
+    )
+    return message.encode()
+
+
 class BaseP2PLibp2pTest:
     """Base class for ACN p2p libp2p tests"""
 
@@ -303,21 +319,38 @@ class BaseP2PLibp2pTest:
     def teardown_class(cls):
         """Tear down the test"""
         logging.debug(f"Cleaning up {cls.__name__}")
-        cls._disconnect()
-        cls.multiplexers.clear()
-        cls.log_files.clear()
-        if Path(cls.cwd).exists():
-            # can be triggered second time by atexit
-            os.chdir(cls.cwd)
-        if Path(cls.tmp).exists():
-            cls.remove_temp_test_dir()
+        try:
+            cls._disconnect()
+        finally:
+            cls.multiplexers.clear()
+            cls.log_files.clear()
+            if Path(cls.cwd).exists():
+                # can be triggered second time by atexit
+                os.chdir(cls.cwd)
+            if Path(cls.tmp).exists():
+                cls.remove_temp_test_dir()
         logging.debug(f"Teardown of {cls.__name__} completed")
 
     @classmethod
     def _disconnect(cls):
         """Disconnect multiplexers and their connections"""
-        for mux in cls.multiplexers:
-            mux.disconnect()
+        # each multiplexer runs its own loop, so they can be torn down in parallel.
+        # plain threads are used since an executor refuses work in atexit hooks.
+        errors: List[Exception] = []
+
+        def disconnect(mux: Multiplexer) -> None:
+            try:
+                mux.disconnect()
+            except Exception as e:  # pylint: disable=broad-except
+                errors.append(e)
+
+        threads = [Thread(target=disconnect, args=(m,)) for m in cls.multiplexers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
         wait_for_condition(lambda: cls.all_disconnected, timeout=TIMEOUT)
 
     @classmethod
@@ -327,22 +360,16 @@ class BaseP2PLibp2pTest:
         if not success:
             logging.debug(f"{cls.tmp} could NOT be deleted")
 
-    def enveloped_default_message(self, to: str, sender: str) -> Envelope:
+    def enveloped_default_message(
+        self, to: str, sender: str, content: bytes = b"hello"
+    ) -> Envelope:
         """Generate a enveloped default message for tests"""
 
-        message = DefaultMessage(
-            dialogue_reference=("", ""),
-            message_id=1,
-            target=0,
-            performative=DefaultMessage.Performative.BYTES,
-            content=b"hello",
-        )
-
         envelope = Envelope(
             to=to,
             sender=sender,
             protocol_specification_id=DefaultMessage.protocol_specification_id,
-            message=message,
+            message=_encode_default_message(content),
         )
 
         return envelope
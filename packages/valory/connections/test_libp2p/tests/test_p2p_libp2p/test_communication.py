@@ -143,12 +143,25 @@ class TestP2PLibp2pConnectionRouting(BaseP2PLibp2pTest):
 
         addrs = [c.address for m in self.multiplexers for c in m.connections]
         nodes = range(len(self.multiplexers))
+
+        # send all envelopes up front so deliveries overlap in flight
+        sent_envelopes = {}
         for u, v in permutations(nodes, 2):
             envelope = self.enveloped_default_message(to=addrs[v], sender=addrs[u])
+            sent_envelopes[(envelope.sender, envelope.to)] = envelope
             self.multiplexers[u].put(envelope)
-            delivered_envelope = self.multiplexers[v].get(block=True, timeout=TIMEOUT)
-            assert delivered_envelope is not None
-            assert self.sent_is_delivered_envelope(envelope, delivered_envelope)
+
+        # arrival order across senders is not guaranteed, match on addresses
+        for v in nodes:
+            for _ in range(len(nodes) - 1):
+                delivered_envelope = self.multiplexers[v].get(
+                    block=True, timeout=TIMEOUT
+                )
+                assert delivered_envelope is not None
+                key = (delivered_envelope.sender, delivered_envelope.to)
+                envelope = sent_envelopes.pop(key)
+                assert self.sent_is_delivered_envelope(envelope, delivered_envelope)
+        assert not sent_envelopes
 
 
 @libp2p_log_on_failure_all
@@ -231,12 +244,25 @@ class TestP2PLibp2pConnectionRoutingRelayTwoDHTNodes(BaseP2PLibp2pTest):
 
         addrs = [c.address for m in self.multiplexers for c in m.connections]
         nodes = range(len(self.multiplexers))
+
+        # send all envelopes up front so deliveries overlap in flight
+        sent_envelopes = {}
         for u, v in permutations(nodes, 2):
             envelope = self.enveloped_default_message(to=addrs[v], sender=addrs[u])
+            sent_envelopes[(envelope.sender, envelope.to)] = envelope
             self.multiplexers[u].put(envelope)
-            delivered_envelope = self.multiplexers[v].get(block=True, timeout=TIMEOUT)
-            assert delivered_envelope is not None
-            assert self.sent_is_delivered_envelope(envelope, delivered_envelope)
+
+        # arrival order across senders is not guaranteed, match on addresses
+        for v in nodes:
+            for _ in range(len(nodes) - 1):
+                delivered_envelope = self.multiplexers[v].get(
+                    block=True, timeout=TIMEOUT
+                )
+                assert delivered_envelope is not None
+                key = (delivered_envelope.sender, delivered_envelope.to)
+                envelope = sent_envelopes.pop(key)
+                assert self.sent_is_delivered_envelope(envelope, delivered_envelope)
+        assert not sent_envelopes
 
 
 @pytest.mark.asyncio
@@ -356,22 +382,19 @@ class TestLibp2pEnvelopeOrder(BaseTestP2PLibp2p):
             self.enveloped_default_message(to, sender) for _ in range(self.NB_ENVELOPES)
         ]
 
-        for envelope in sent_envelopes:
-            envelope.message = envelope.message_bytes  # encode
-            self.multiplexers[0].put(envelope)
+        self.multiplexers[0].put_many(sent_envelopes)
 
-        received_envelopes = []
-        for _ in range(self.NB_ENVELOPES):
-            envelope = self.multiplexers[1].get(block=True, timeout=3)
-            received_envelopes.append(envelope)
+        received_envelopes = self.multiplexers[1].get_many(
+            self.NB_ENVELOPES, timeout=TIMEOUT
+        )
 
         # test no new message is "created"
         with pytest.raises(Empty):
             self.multiplexers[1].get(block=True, timeout=1)
 
         assert len(sent_envelopes) == len(received_envelopes)
-        for expected, actual in zip(sent_envelopes, received_envelopes):
-            assert expected.message == actual.message
+        sent_messages = [envelope.message for envelope in sent_envelopes]
+        assert sent_messages == [envelope.message for envelope in received_envelopes]
 
 
 @pytest.mark.asyncio
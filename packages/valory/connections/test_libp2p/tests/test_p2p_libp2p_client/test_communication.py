@@ -22,7 +22,7 @@
 
 # pylint: skip-file
 
-import time
+from collections import defaultdict
 from unittest import mock
 from unittest.mock import call
 
@@ -31,6 +31,7 @@ import pytest
 from aea.configurations.constants import DEFAULT_LEDGER
 from aea.mail.base import Empty
 from aea.test_tools.mocks import RegexComparator
+from aea.test_tools.utils import wait_for_condition
 
 from packages.valory.connections.p2p_libp2p.tests.base import libp2p_log_on_failure_all
 from packages.valory.connections.test_libp2p.tests.base import (
@@ -159,13 +160,14 @@ class TestLibp2pClientConnectionEchoEnvelope(BaseP2PLibp2pTest):
 
 
 @libp2p_log_on_failure_all
-class TestLibp2pClientConnectionEchoEnvelopeTwoDHTNode(BaseP2PLibp2pTest):
+class TestLibp2pClientConnectionEchoEnvelopeTwoDHTNode(TestP2PLibp2pConnectionRouting):
     """Test that connection will route envelope to destination connected to different node"""
 
     @classmethod
     def setup_class(cls):
         """Set the test up"""
-        super().setup_class()
+        # skip the routing setup, but run the base setup on this class
+        super(TestP2PLibp2pConnectionRouting, cls).setup_class()
 
         cls.ports = next(ports), next(ports)
 
@@ -189,10 +191,6 @@ class TestLibp2pClientConnectionEchoEnvelopeTwoDHTNode(BaseP2PLibp2pTest):
             node_port=cls.ports[1],
         )
 
-    def test_connection_is_established(self):
-        """Test the connection is established."""
-        assert self.all_connected
-
     def test_envelope_routed(self):
         """Test the envelope is routed."""
 
@@ -243,39 +241,9 @@ class TestLibp2pClientConnectionEchoEnvelopeTwoDHTNode(BaseP2PLibp2pTest):
         assert self.sent_is_echoed_envelope(envelope, echoed_envelope)
 
 
-@libp2p_log_on_failure_all
-class TestLibp2pClientConnectionRouting(TestP2PLibp2pConnectionRouting):
-    """Test that libp2p DHT network will reliably route envelopes from clients connected to different nodes"""
-
-    @classmethod
-    def setup_class(cls):
-        """Set the test up"""
-        BaseP2PLibp2pTest.setup_class()
-
-        cls.ports = next(ports), next(ports)
-        connection1 = cls.make_connection(
-            delegate_port=cls.ports[0],
-            delegate=True,
-        )
-        entry_peer = connection1.node.multiaddrs[0]
-        connection2 = cls.make_connection(
-            delegate_port=cls.ports[1],
-            entry_peers=[entry_peer],
-            delegate=True,
-        )
-
-        peers_public_keys = [connection1.node.pub, connection2.node.pub]
-        assert len(cls.ports) == len(peers_public_keys)
-        for port, peer_public_key in zip(cls.ports, peers_public_keys):
-            cls.make_client_connection(
-                peer_public_key=peer_public_key,
-                node_port=port,
-            )
-
-
 @libp2p_log_on_failure_all
 class BaseTestLibp2pClientSamePeer(BaseP2PLibp2pTest):
-    """Base test class for reconnection tests."""
+    """Base test class for two clients connected to the same peer."""
 
     @classmethod
     def setup_class(cls):
@@ -301,11 +269,11 @@ class BaseTestLibp2pClientSamePeer(BaseP2PLibp2pTest):
 
 
 @libp2p_log_on_failure_all
-class TestLibp2pClientReconnectionSendEnvelope(BaseTestLibp2pClientSamePeer):
-    """Test that connection will send envelope with error, and that reconnection fixes it."""
+class TestLibp2pClientReconnection(BaseTestLibp2pClientSamePeer):
+    """Test that connection will send and receive envelope with error, and that reconnection fixes it."""
 
     def test_envelope_sent(self):
-        """Test the envelope is routed."""
+        """Test that envelope sent with error is delivered after reconnection."""
         sender = self.connection_client_1.address
         to = self.connection_client_2.address
         envelope = self.enveloped_default_message(to=to, sender=sender)
@@ -323,13 +291,8 @@ class TestLibp2pClientReconnectionSendEnvelope(BaseTestLibp2pClientSamePeer):
 
         assert self.sent_is_delivered_envelope(envelope, delivered_envelope)
 
-
-@libp2p_log_on_failure_all
-class TestLibp2pClientReconnectionReceiveEnvelope(BaseTestLibp2pClientSamePeer):
-    """Test that connection will receive envelope with error, and that reconnection fixes it."""
-
     def test_envelope_received(self):
-        """Test the envelope is routed."""
+        """Test that envelope received with error is delivered after reconnection."""
         sender = self.connection_client_2.address
         to = self.connection_client_1.address
         envelope = self.enveloped_default_message(to=to, sender=sender)
@@ -344,9 +307,11 @@ class TestLibp2pClientReconnectionReceiveEnvelope(BaseTestLibp2pClientSamePeer):
         ):
             # this envelope will be lost.
             self.multiplexers[2].put(envelope)
-            time.sleep(2.0)
             expected = "Connection error:.*Try to reconnect and read again"
-            _mock_logger.assert_has_calls([call(RegexComparator(expected))])
+            expected_call = call(RegexComparator(expected))
+            wait_for_condition(
+                lambda: expected_call in _mock_logger.call_args_list, timeout=TIMEOUT
+            )
 
         # proceed as usual. Now we expect the connection to have reconnected successfully
         delivered_envelope = self.multiplexers[1].get(block=True, timeout=20)
@@ -358,29 +323,71 @@ class TestLibp2pClientEnvelopeOrderSamePeer(BaseTestLibp2pClientSamePeer):
     """Test that the order of envelope is the guaranteed to be the same."""
 
     NB_ENVELOPES = 1000
+    MAX_BURST_BYTES = 4 * 1024 * 1024  # caps the burst size for large payloads
 
-    def test_burst_order(self):
+    @pytest.mark.parametrize("content", [b"h" * 16, b"h" * 4096, b"h" * 65536])
+    def test_burst_order(self, content):
         """Test order of envelope burst is guaranteed on receiving end."""
 
         sender = self.connection_client_1.address
         to = self.connection_client_2.address
+        nb_envelopes = min(self.NB_ENVELOPES, self.MAX_BURST_BYTES // len(content))
         sent_envelopes = [
-            self.enveloped_default_message(to, sender) for _ in range(self.NB_ENVELOPES)
+            self.enveloped_default_message(to, sender, content=content)
+            for _ in range(nb_envelopes)
         ]
+        self.multiplexers[1].put_many(sent_envelopes)
 
-        for envelope in sent_envelopes:
-            envelope.message = envelope.message_bytes  # encode
-            self.multiplexers[1].put(envelope)
-
-        received_envelopes = []
-        for _ in range(self.NB_ENVELOPES):
-            envelope = self.multiplexers[2].get(block=True, timeout=3)
-            received_envelopes.append(envelope)
+        received_envelopes = self.multiplexers[2].get_many(
+            nb_envelopes, timeout=TIMEOUT
+        )
 
         # test no new message is "created"
         with pytest.raises(Empty):
             self.multiplexers[2].get(block=True, timeout=1)
 
         assert len(sent_envelopes) == len(received_envelopes)
-        for expected, actual in zip(sent_envelopes, received_envelopes):
-            assert expected.message == actual.message
+        sent_messages = [envelope.message for envelope in sent_envelopes]
+        assert sent_messages == [envelope.message for envelope in received_envelopes]
+
+    def test_burst_order_multi_sender(self):
+        """Test order of concurrent envelope bursts is guaranteed per sender."""
+
+        nb_senders = 4
+        senders = [(self.connection_client_1.address, self.multiplexers[1])]
+        extra_multiplexers = []
+        try:
+            for _ in range(nb_senders - 1):
+                connection = self.make_client_connection(
+                    peer_public_key=self.connection_node.node.pub,
+                    node_port=self.delegate_port,
+                )
+                extra_multiplexers.append(self.multiplexers[-1])
+                senders.append((connection.address, self.multiplexers[-1]))
+
+            to = self.connection_client_2.address
+            nb_envelopes = self.NB_ENVELOPES // nb_senders
+            sent_envelopes = {}
+            for sender, multiplexer in senders:
+                sent_envelopes[sender] = [
+                    self.enveloped_default_message(to, sender, content=str(i).encode())
+                    for i in range(nb_envelopes)
+                ]
+                multiplexer.put_many(sent_envelopes[sender])
+
+            received_envelopes = defaultdict(list)
+            for envelope in self.multiplexers[2].get_many(
+                nb_senders * nb_envelopes, timeout=TIMEOUT
+            ):
+                received_envelopes[envelope.sender].append(envelope)
+        finally:
+            # leave the class harness as it was for the other tests
+            for multiplexer in extra_multiplexers:
+                multiplexer.disconnect()
+                self.multiplexers.remove(multiplexer)
+
+        # senders interleave, only the order within each burst is guaranteed
+        assert received_envelopes.keys() == sent_envelopes.keys()
+        for sender, envelopes in sent_envelopes.items():
+            received = [e.message for e in received_envelopes[sender]]
+            assert received == [e.message for e in envelopes]
@@ -23,7 +23,6 @@
 # pylint: skip-file
 
 from itertools import permutations
-from unittest.mock import Mock
 
 import pytest
 from aea_ledger_cosmos import CosmosCrypto
@@ -31,7 +30,6 @@ from aea_ledger_ethereum import EthereumCrypto
 
 from aea.mail.base import Empty
 
-from packages.fetchai.protocols.default.message import DefaultMessage
 from packages.valory.connections.p2p_libp2p.tests.base import libp2p_log_on_failure_all
 from packages.valory.connections.test_libp2p.tests.base import (
     BaseP2PLibp2pTest,
@@ -44,12 +42,6 @@ from packages.valory.connections.test_libp2p.tests.base import (
 
 DEFAULT_CLIENTS_PER_NODE = 1
 
-MockDefaultMessageProtocol = Mock()
-MockDefaultMessageProtocol.protocol_id = DefaultMessage.protocol_id
-MockDefaultMessageProtocol.protocol_specification_id = (
-    DefaultMessage.protocol_specification_id
-)
-
 
 @pytest.mark.asyncio
 class TestLibp2pMailboxConnectionConnectDisconnect(BaseP2PLibp2pTest):
@@ -230,12 +222,25 @@ class TestLibp2pClientConnectionRouting(BaseP2PLibp2pTest):
 
         addrs = [c.address for m in self.multiplexers for c in m.connections]
         nodes = range(len(self.multiplexers))
+
+        # send all envelopes up front so deliveries overlap in flight
+        sent_envelopes = {}
         for u, v in permutations(nodes, 2):
             envelope = self.enveloped_default_message(to=addrs[v], sender=addrs[u])
+            sent_envelopes[(envelope.sender, envelope.to)] = envelope
             self.multiplexers[u].put(envelope)
-            delivered_envelope = self.multiplexers[v].get(block=True, timeout=TIMEOUT)
-            assert delivered_envelope is not None
-            assert self.sent_is_delivered_envelope(envelope, delivered_envelope)
+
+        # arrival order across senders is not guaranteed, match on addresses
+        for v in nodes:
+            for _ in range(len(nodes) - 1):
+                delivered_envelope = self.multiplexers[v].get(
+                    block=True, timeout=TIMEOUT
+                )
+                assert delivered_envelope is not None
+                key = (delivered_envelope.sender, delivered_envelope.to)
+                envelope = sent_envelopes.pop(key)
+                assert self.sent_is_delivered_envelope(envelope, delivered_envelope)
+        assert not sent_envelopes
 
 
 @libp2p_log_on_failure_all
@@ -283,19 +288,16 @@ class TestLibp2pClientEnvelopeOrderSamePeer(BaseTestLibp2pClientSamePeer):
         sent_envelopes = [
             self.enveloped_default_message(to, sender) for _ in range(self.NB_ENVELOPES)
         ]
-        for envelope in sent_envelopes:
-            envelope.message = envelope.message_bytes  # encode
-            self.multiplexers[1].put(envelope)
+        self.multiplexers[1].put_many(sent_envelopes)
 
-        received_envelopes = []
-        for _ in range(self.NB_ENVELOPES):
-            envelope = self.multiplexers[2].get(block=True, timeout=20)
-            received_envelopes.append(envelope)
+        received_envelopes = self.multiplexers[2].get_many(
+            self.NB_ENVELOPES, timeout=TIMEOUT
+        )
 
         # test no new message is "created"
         with pytest.raises(Empty):
             self.multiplexers[2].get(block=True, timeout=1)
 
         assert len(sent_envelopes) == len(received_envelopes)
-        for expected, actual in zip(sent_envelopes, received_envelopes):
-            assert expected.message == actual.message
+        sent_messages = [envelope.message for envelope in sent_envelopes]
+        assert sent_messages == [envelope.message for envelope in received_envelopes]
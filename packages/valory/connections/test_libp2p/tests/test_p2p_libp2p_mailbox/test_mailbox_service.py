@@ -30,20 +30,12 @@ import requests
 
 from aea.mail.base import Envelope
 
-from packages.fetchai.protocols.default.message import DefaultMessage
 from packages.valory.connections.p2p_libp2p_mailbox.connection import NodeClient
 from packages.valory.connections.test_libp2p.tests.base import BaseP2PLibp2pTest, ports
 from packages.valory.protocols.acn import acn_pb2
 from packages.valory.protocols.acn.message import AcnMessage
 
 
-MockDefaultMessageProtocol = Mock()
-MockDefaultMessageProtocol.protocol_id = DefaultMessage.protocol_id
-MockDefaultMessageProtocol.protocol_specification_id = (
-    DefaultMessage.protocol_specification_id
-)
-
-
 @pytest.mark.asyncio
 class TestMailboxAPI(BaseP2PLibp2pTest):
     """Test that connection is established and torn down correctly"""
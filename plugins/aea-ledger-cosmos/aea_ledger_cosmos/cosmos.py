@@ -28,10 +28,11 @@ import json
 import logging
 import time
 from collections import namedtuple
+from functools import lru_cache
 from itertools import chain
 from json.decoder import JSONDecodeError
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from Crypto.Cipher import AES  # nosec
 from Crypto.Protocol.KDF import scrypt  # nosec
@@ -112,6 +113,27 @@ DEFAULT_GAS_AMOUNT = 1550000
 # Txs will fail if gas_limit is higher than MAXIMUM_GAS_AMOUNT
 MAXIMUM_GAS_AMOUNT = 2000000
 _BYTECODE = "wasm_byte_code"
+ADDRESS_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _derive_address(address_prefix: str, public_key: str) -> str:
+    """
+    Derive the bech32 address of a public key.
+
+    The derivation is a pure function of its inputs, so results are cached.
+
+    :param address_prefix: the bech32 human readable prefix
+    :param public_key: the public key in hex format
+    :return: the address
+    """
+    public_key_bytes = bytes.fromhex(public_key)
+    s = sha256(public_key_bytes)
+    r = ripemd160(s)
+    five_bit_r = convertbits(r, 8, 5)
+    if five_bit_r is None:  # pragma: nocover
+        raise AEAEnforceError("Unsuccessful bech32.convertbits call")
+    return bech32_encode(address_prefix, five_bit_r)
 
 
 class DataEncrypt:
@@ -308,14 +330,14 @@ class CosmosHelper(Helper):
             return False  # pragma: no cover
 
         try:
-            _tx = cast(dict, tx.get("tx", {})).get("body", {}).get("messages", [])[0]
-            recovered_amount = int(_tx.get("amount")[0].get("amount"))
-            sender = _tx.get("fromAddress")
-            recipient = _tx.get("toAddress")
+            _tx: Dict[str, Any] = tx["tx"]["body"]["messages"][0]  # type: ignore
+            recovered_amount = int(_tx["amount"][0]["amount"])
             is_valid = (
-                recovered_amount == amount and sender == client and recipient == seller
+                recovered_amount == amount
+                and _tx["fromAddress"] == client
+                and _tx["toAddress"] == seller
             )
-        except (KeyError, IndexError):  # pragma: no cover
+        except (KeyError, IndexError, TypeError):
             is_valid = False
         return is_valid
 
@@ -342,14 +364,7 @@ class CosmosHelper(Helper):
         :param public_key: the public key
         :return: str
         """
-        public_key_bytes = bytes.fromhex(public_key)
-        s = sha256(public_key_bytes)
-        r = ripemd160(s)
-        five_bit_r = convertbits(r, 8, 5)
-        if five_bit_r is None:  # pragma: nocover
-            raise AEAEnforceError("Unsuccessful bech32.convertbits call")
-        address = bech32_encode(cls.address_prefix, five_bit_r)
-        return address
+        return _derive_address(cls.address_prefix, public_key)
 
     @classmethod
     def recover_message(
@@ -413,6 +428,10 @@ class CosmosHelper(Helper):
         :param address: the address to validate
         :return: whether address is valid or not
         """
+        # reject addresses of other chains before running the bech32 checksum
+        hrp_with_separator = cls.address_prefix + "1"
+        if address[: len(hrp_with_separator)].lower() != hrp_with_separator:
+            return False
         result = bech32_decode(address)
         return result != (None, None) and result[0] == cls.address_prefix
 
@@ -698,15 +717,10 @@ class _CosmosApi(LedgerApi):
         self, callable_name: str, *args: Any, **kwargs: Any
     ) -> Optional[JSONLike]:
         """Try to call a function on the ledger API."""
-        result: Optional[JSONLike] = None
         query = "/".join(args)
-        url = self.network_address + f"/{callable_name}/{query}"
-        response = requests.get(url=url)
-        if response.status_code == 200:
-            result = response.json()
-        else:  # pragma: nocover
-            raise ValueError("Cannot get state: {}".format(response.json()))
-        return result
+        # go through the rest client to reuse its pooled keep-alive session
+        response = self.rest_client.get(f"/{callable_name}/{query}")
+        return json.loads(response)
 
     def get_deploy_transaction(
         self,
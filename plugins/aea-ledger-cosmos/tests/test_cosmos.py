@@ -28,6 +28,7 @@ from uuid import uuid4
 import pytest  # type:ignore
 from aea_ledger_cosmos import CosmosApi, CosmosCrypto, CosmosHelper
 from aea_ledger_cosmos.cosmos import _default_logger as cosmos_logger
+from aea_ledger_cosmos.cosmos import _derive_address
 
 from tests.conftest import COSMOS_TESTNET_CONFIG, ROOT_DIR
 
@@ -83,6 +84,24 @@ def test_initialization():
     ), "After creation the public key must no be None"
 
 
+def test_get_address_from_public_key_is_cached():
+    """Test that address derivation is cached per prefix and public key."""
+
+    class OtherHelper(CosmosHelper):
+        address_prefix = "other"
+
+    account = CosmosCrypto()
+    _derive_address.cache_clear()
+    address = CosmosHelper.get_address_from_public_key(account.public_key)
+    assert address == account.address
+    assert CosmosHelper.get_address_from_public_key(account.public_key) == address
+    assert _derive_address.cache_info().hits == 1
+
+    other_address = OtherHelper.get_address_from_public_key(account.public_key)
+    assert other_address.startswith("other1")
+    assert other_address != address
+
+
 def test_sign_and_recover_message(cosmos_private_key_file):
     """Test the signing and the recovery of a message."""
     account = CosmosCrypto(cosmos_private_key_file)
@@ -152,7 +171,9 @@ def test_validate_address():
     """Test the is_valid_address functionality."""
     account = CosmosCrypto()
     assert CosmosApi.is_valid_address(account.address)
+    assert CosmosApi.is_valid_address(account.address.upper())
     assert not CosmosApi.is_valid_address(account.address + "wrong")
+    assert not CosmosApi.is_valid_address("fetch" + account.address[len("cosmos") :])
 
 
 def test_load_contract_interface():
@@ -261,3 +282,14 @@ def test_cosmos_api_get_transfer_transaction(*args):
     """Test CosmosApi.get_transfer_transaction."""
     cosmos_api = CosmosApi()
     assert cosmos_api.get_transfer_transaction(*[Mock()] * 7) is None
+
+
+def test_cosmos_api_get_state():
+    """Test CosmosApi.get_state goes through the rest client session."""
+    cosmos_api = CosmosApi()
+    with patch.object(
+        cosmos_api.rest_client, "get", return_value=b'{"height": "1"}'
+    ) as mock_get:
+        result = cosmos_api.get_state("blocks", "latest")
+    mock_get.assert_called_once_with("/blocks/latest")
+    assert result == {"height": "1"}
@@ -50,6 +50,9 @@ def test_is_transaction_valid() -> None:
     }
     assert CosmosHelper.is_transaction_valid(tx_good, 2, 1, 3, 4)
     assert not CosmosHelper.is_transaction_valid(tx_good, 2, 2, 3, 4)
+    tx_bad = {"tx": {"body": {"messages": [{"fromAddress": 1, "toAddress": 2}]}}}
+    assert not CosmosHelper.is_transaction_valid(tx_bad, 2, 1, 3, 4)
+    assert not CosmosHelper.is_transaction_valid({"tx": {}}, 2, 1, 3, 4)
 
 
 @pytest.mark.flaky(reruns=MAX_FLAKY_RERUNS)
@@ -82,3 +82,23 @@ def test_many_threads_with_asyncio() -> None:
         t.join()
 
     assert len(results) == num_threads
+
+
+def test_get_many() -> None:
+    """Test AsyncFriendlyQueue.get_many waits for the whole batch."""
+    sq = AsyncFriendlyQueue()
+    sq.put("item_0")
+
+    with pytest.raises(Empty):
+        sq.get_many(2, timeout=0.1)
+    assert sq.qsize() == 1
+
+    def put_later() -> None:
+        time.sleep(0.05)
+        sq.put("item_1")
+
+    t = Thread(target=put_later)
+    t.start()
+    assert sq.get_many(2, timeout=5) == ["item_0", "item_1"]
+    t.join()
+    assert sq.empty()
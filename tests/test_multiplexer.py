@@ -414,6 +414,29 @@ def test_send_envelope_error_is_logged_by_send_loop():
     multiplexer.disconnect()
 
 
+def test_put_many_preserves_order():
+    """Test that a batch of envelopes put at once is sent in order."""
+    connection = _make_dummy_connection()
+    multiplexer = Multiplexer([connection], protocols=[DefaultProtocolMock])
+    multiplexer.connect()
+
+    envelopes = [
+        Envelope(
+            to="to",
+            sender="sender",
+            protocol_specification_id=DefaultMessage.protocol_specification_id,
+            message=str(i).encode(),
+        )
+        for i in range(10)
+    ]
+    try:
+        multiplexer.put_many(envelopes)
+        received = multiplexer.get_many(len(envelopes), timeout=3)
+        assert [e.message for e in received] == [e.message for e in envelopes]
+    finally:
+        multiplexer.disconnect()
+
+
 def test_get_from_multiplexer_when_empty():
     """Test that getting an envelope from the multiplexer when the input queue is empty raises an exception."""
     connection = _make_dummy_connection()
@@ -423,6 +446,15 @@ def test_get_from_multiplexer_when_empty():
         multiplexer.get()
 
 
+def test_get_many_from_multiplexer_when_not_enough_envelopes():
+    """Test that getting a batch larger than the input queue raises an exception."""
+    connection = _make_dummy_connection()
+    multiplexer = Multiplexer([connection])
+
+    with pytest.raises(aea.mail.base.Empty):
+        multiplexer.get_many(1, timeout=0.1)
+
+
 def test_send_message_no_supported_protocol():
     """Test the case when we send an envelope with a specific connection that does not support the protocol."""
     with LocalNode() as node:
@@ -620,6 +652,57 @@ async def test_threaded_mode():
         await multiplexer.disconnect()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threaded", [False, True])
+async def test_async_multiplexer_put_many_preserves_order(threaded):
+    """Test that AsyncMultiplexer.put_many sends a batch of envelopes in order."""
+    connection_1 = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection_1],
+        protocols=[DefaultProtocolMock],
+        loop=None if threaded else asyncio.get_event_loop(),
+        threaded=threaded,
+    )
+    envelopes = [
+        Envelope(
+            to="to",
+            sender="sender",
+            protocol_specification_id=DefaultMessage.protocol_specification_id,
+            message=str(i).encode(),
+        )
+        for i in range(10)
+    ]
+    try:
+        await multiplexer.connect()
+        multiplexer.put_many(iter(envelopes))
+        received = [await multiplexer.async_get() for _ in envelopes]
+        assert [e.message for e in received] == [e.message for e in envelopes]
+        assert multiplexer.in_queue.empty()
+    finally:
+        await multiplexer.disconnect()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threaded", [False, True])
+async def test_async_multiplexer_put_many_empty(threaded):
+    """Test that AsyncMultiplexer.put_many accepts an empty iterable."""
+    connection_1 = _make_dummy_connection()
+    multiplexer = AsyncMultiplexer(
+        [connection_1],
+        protocols=[DefaultProtocolMock],
+        loop=None if threaded else asyncio.get_event_loop(),
+        threaded=threaded,
+    )
+    try:
+        await multiplexer.connect()
+        multiplexer.put_many(iter([]))
+        await asyncio.sleep(0.1)
+        assert multiplexer.out_queue.empty()
+        assert multiplexer.in_queue.empty()
+    finally:
+        await multiplexer.disconnect()
+
+
 @pytest.mark.asyncio
 async def test_outbox_negative():
     """Test InBox OutBox objects."""